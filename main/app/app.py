@@ -1,18 +1,33 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, Response, stream_with_context
 import os
+import threading
 from dotenv import load_dotenv
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from llm_interface.llama_api import LlamaAPI
+from llm_interface.llama_api import LlamaAPI, dumps_json
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 
-# Initialize Llama API
-llama_api = LlamaAPI()
+# Llama API is created on first use so the server starts without blocking
+llama_api = None
+_llama_api_lock = threading.Lock()
+
+def get_llama_api():
+    """Return the shared LlamaAPI instance, creating it on first call."""
+    global llama_api
+    if llama_api is None:
+        with _llama_api_lock:
+            if llama_api is None:
+                llama_api = LlamaAPI()
+    return llama_api
+
+def ojsonify(obj, status=200):
+    """Return obj as a compact JSON response."""
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
 
 @app.route('/')
 def index():
@@ -25,16 +40,43 @@ def chat():
         user_message = data.get('message', '')
         
         if not user_message:
-            return jsonify({'error': 'Message is empty.'}), 400
+            return ojsonify({'error': 'Message is empty.'}, 400)
         
         # Get response from Llama API
-        response = llama_api.get_response(user_message)
+        response = get_llama_api().get_response(user_message)
         
-        return jsonify({'response': response})
+        return ojsonify({'response': response})
         
     except Exception as e:
         print(f"Error in chat endpoint: {e}")
-        return jsonify({'error': 'Server error occurred.'}), 500
+        return ojsonify({'error': 'Server error occurred.'}, 500)
+
+@app.route('/chat/stream', methods=['POST'])
+def chat_stream():
+    try:
+        data = request.get_json()
+        user_message = data.get('message', '')
+        
+        if not user_message:
+            return ojsonify({'error': 'Message is empty.'}, 400)
+        
+        engine = get_llama_api()
+        
+    except Exception as e:
+        print(f"Error in chat stream endpoint: {e}")
+        return ojsonify({'error': 'Server error occurred.'}, 500)
+    
+    def generate():
+        # Server-sent events: one data frame per chunk, then a done event
+        for chunk in engine.stream_response(user_message):
+            yield b"data: " + dumps_json({'chunk': chunk}) + b"\n\n"
+        yield b"event: done\ndata: {}\n\n"
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001) 
\ No newline at end of file
+    # Development server only. Requests spend most of their time waiting on the
+    # Llama API, so serve them on threads; in production run e.g.
+    #   gunicorn -w 4 -k gthread --threads 8 app:app
+    print("Warning: using the Flask development server; see README.md for production use.")
+    app.run(debug=True, threaded=True, host='0.0.0.0', port=5001) 
\ No newline at end of file
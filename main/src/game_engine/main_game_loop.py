@@ -1,12 +1,96 @@
 import json
 import os
-from src.llm_interface.llama_api import call_llama_api
+import hashlib
+import atexit
+import threading
+import random
+from functools import lru_cache
+from src.llm_interface.llama_api import call_llama_api, summarize_history, dumps_json, STORY_FALLBACK_RESPONSE
+from src.game_engine.story_data import (
+    STORY_MENU_MESSAGE, HARRY_POTTER_WORLD_KNOWLEDGE, HARRY_POTTER_TURN_KNOWLEDGE, HARRY_POTTER_START_STATE, HARRY_POTTER_OPENING,
+    SHADOW_SERPENT_OPENING
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Saves are compact by default; set DEBUG_PRETTY_JSON=1 to get indented files
+PRETTY_JSON = os.getenv('DEBUG_PRETTY_JSON') == '1'
+
+def _read_json(path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, data):
+    """Write data to a JSON file."""
+    with open(path, 'wb') as f:
+        f.write(dumps_json(data, indent=PRETTY_JSON))
+
+KNOWLEDGE_BASE_DIR = 'knowledge_base'
+GAME_STATE_PATH = os.path.join(KNOWLEDGE_BASE_DIR, 'game_state.json')
+WORLD_KNOWLEDGE_PATH = os.path.join(KNOWLEDGE_BASE_DIR, 'world_knowledge_graph.json')
+BOOK_DIR = 'book_data'
+FIRST_TURNS_DIR = os.path.join(KNOWLEDGE_BASE_DIR, 'first_turns')
+
+# Story openings are generated live until FIRST_TURN_OPENINGS of them are stored in FIRST_TURNS_DIR,
+# then served from there at random; set LIVE_FIRST_TURN=1 to ask the model every time (e.g. while tuning prompts)
+LIVE_FIRST_TURN = os.getenv('LIVE_FIRST_TURN') == '1'
+FIRST_TURN_OPENINGS = 5
+
+# History entries sent to the model (a Player/Narrator pair per turn, so the last 20 turns);
+# older turns survive only as the running history_summary
+HISTORY_WINDOW = 40
+# Once the stored log outgrows the window, its oldest SUMMARY_BATCH entries are folded into a summary
+# on a background thread; after a failed fold the next try waits for another SUMMARY_BATCH entries
+SUMMARY_BATCH = 20
+# Hard limit on stored entries: if summaries keep failing, the oldest entries are dropped
+HISTORY_MAX_ENTRIES = HISTORY_WINDOW + 4 * SUMMARY_BATCH
+
+# Full rewrites of the state file are batched rather than done on every turn:
+# pending changes are written after SAVE_EVERY_N_TURNS saves or SAVE_DELAY_SECONDS, whichever comes first
+SAVE_EVERY_N_TURNS = 5
+SAVE_DELAY_SECONDS = 2.0
+
+# Loaded once per process; after that the in-memory copies are authoritative
+_game_state = None
+_world_knowledge = None
+# Copy of the state taken at the last save; the timer thread only ever serializes this
+_pending_state = None
+_unsaved_saves = 0
+_game_state_mtime = None
+_save_timer = None
+_last_saved_digest = None
+_save_lock = threading.RLock()
+_fold_running = False
+# (history list, length it must reach) after a failed fold
+_fold_backoff = (None, 0)
+
+def _mtime(path):
+    """Return the modification time of path, or None if it does not exist."""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
 
 def load_game_state():
+    """Return the in-memory game state, re-reading the file only if it was changed on disk."""
+    global _game_state, _game_state_mtime
+    # Unsaved in-memory changes win over the file; otherwise pick up external edits
+    if _game_state is None or (not _unsaved_saves and _mtime(GAME_STATE_PATH) != _game_state_mtime):
+        _game_state = _read_game_state()
+        _game_state_mtime = _mtime(GAME_STATE_PATH)
+    return _game_state
+
+def _read_game_state():
     """Load the current game state from JSON file."""
     try:
-        with open('knowledge_base/game_state.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(GAME_STATE_PATH)
     except FileNotFoundError:
         print("Game state file not found. Creating default state.")
         return create_default_game_state()
@@ -15,10 +99,16 @@ def load_game_state():
         return create_default_game_state()
 
 def load_world_knowledge():
+    """Return the world knowledge, reading it from disk on first use (it is read-only at runtime)."""
+    global _world_knowledge
+    if _world_knowledge is None:
+        _world_knowledge = _read_world_knowledge()
+    return _world_knowledge
+
+def _read_world_knowledge():
     """Load the world knowledge from JSON file."""
     try:
-        with open('knowledge_base/world_knowledge_graph.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _read_json(WORLD_KNOWLEDGE_PATH)
     except FileNotFoundError:
         print("World knowledge file not found.")
         return {}
@@ -39,19 +129,97 @@ def create_default_game_state():
     }
     
     # Save the default state
-    os.makedirs('knowledge_base', exist_ok=True)
-    with open('knowledge_base/game_state.json', 'w', encoding='utf-8') as f:
-        json.dump(default_state, f, indent=2, ensure_ascii=False)
+    os.makedirs(KNOWLEDGE_BASE_DIR, exist_ok=True)
+    _write_json(GAME_STATE_PATH, default_state)
     
     return default_state
 
 def save_game_state(game_state):
-    """Save the current game state to JSON file."""
+    """Record the current game state and schedule a write to disk on a background thread."""
+    global _game_state, _pending_state, _unsaved_saves, _save_timer
+    with _save_lock:
+        _game_state = game_state
+        # Callers keep mutating game_state, so the writer gets its own history list
+        _pending_state = {**game_state, 'conversation_history': list(game_state.get('conversation_history', []))}
+        _unsaved_saves += 1
+        # Enough changes are pending: write now, but still off the request thread
+        delay = 0 if _unsaved_saves >= SAVE_EVERY_N_TURNS else SAVE_DELAY_SECONDS
+        if _save_timer is not None:
+            if delay:
+                return
+            _save_timer.cancel()
+        _save_timer = threading.Timer(delay, flush_game_state)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+def flush_game_state():
+    """Write the last saved game state snapshot to JSON file if it has unsaved changes."""
+    global _unsaved_saves, _game_state_mtime, _save_timer, _last_saved_digest
+    with _save_lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        if _pending_state is None or not _unsaved_saves:
+            return
+        try:
+            data = dumps_json(_pending_state, indent=PRETTY_JSON)
+            # Skip the write when the state is byte-for-byte what was last saved
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if digest != _last_saved_digest or _mtime(GAME_STATE_PATH) != _game_state_mtime:
+                with open(GAME_STATE_PATH, 'wb') as f:
+                    f.write(data)
+                _game_state_mtime = _mtime(GAME_STATE_PATH)
+                _last_saved_digest = digest
+            _unsaved_saves = 0
+        except Exception as e:
+            print(f"Error saving game state: {e}")
+
+# Whatever is still pending is written when the process exits
+atexit.register(flush_game_state)
+
+def context_game_state(game_state):
+    """Return a copy of game_state whose conversation history is cut to the last HISTORY_WINDOW entries."""
+    return {**game_state, 'conversation_history': game_state.get('conversation_history', [])[-HISTORY_WINDOW:]}
+
+def compact_history(game_state):
+    """Bound the stored history and start folding its oldest entries into a summary once it outgrows the window."""
+    global _fold_running
+    history = game_state.get('conversation_history', [])
+    with _save_lock:
+        if len(history) > HISTORY_MAX_ENTRIES:
+            del history[:len(history) - HISTORY_MAX_ENTRIES]
+        if _fold_running or len(history) < HISTORY_WINDOW + SUMMARY_BATCH:
+            return
+        backoff_history, retry_at = _fold_backoff
+        if backoff_history is history and len(history) < retry_at:
+            return
+        _fold_running = True
+    
+    worker = threading.Thread(
+        target=_fold_history,
+        args=(game_state, history, history[:SUMMARY_BATCH], game_state.get('history_summary', '')),
+        daemon=True
+    )
+    worker.start()
+
+def _fold_history(game_state, history, batch, summary):
+    """Summarize batch off the request thread and drop it from history if it is still at the front."""
+    global _fold_running, _fold_backoff
     try:
-        with open('knowledge_base/game_state.json', 'w', encoding='utf-8') as f:
-            json.dump(game_state, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"Error saving game state: {e}")
+        new_summary = summarize_history(summary, batch)
+        with _save_lock:
+            if new_summary is None:
+                _fold_backoff = (history, len(history) + SUMMARY_BATCH)
+                return
+            # A new story may have replaced the history, or the hard cap trimmed it, meanwhile
+            if game_state.get('conversation_history') is not history or history[:len(batch)] != batch:
+                return
+            del history[:len(batch)]
+            game_state['history_summary'] = new_summary
+            save_game_state(game_state)
+    finally:
+        with _save_lock:
+            _fold_running = False
 
 def start_game():
     """Initialize the game and return the opening message."""
@@ -59,7 +227,7 @@ def start_game():
     
     if not game_state.get('conversation_history'):
         # This is a new game, return the story selection message
-        return "어떠한 스토리를 넣고 싶습니까?\n\n1. Harry Potter and the Sorcerer's Stone - 마법의 세계로 들어가 해리 포터가 되어보세요.\n2. The Shadow of the Serpent's Eye - 고대 유물을 둘러싼 판타지 모험의 세계.\n\n원하는 스토리를 선택해주세요."
+        return STORY_MENU_MESSAGE
     
     # Return the last message from conversation history
     return game_state['conversation_history'][-1]
@@ -76,60 +244,25 @@ def process_player_input(player_input: str, story_id: str = "shadow_serpent"):
         The response from the game
     """
     game_state = load_game_state()
-    world_knowledge = load_world_knowledge()
     
     # Check if this is the first interaction and we need to start a story
     if not game_state.get('conversation_history') or len(game_state['conversation_history']) == 0:
         # This is the first interaction, start the selected story
-        if story_id == "harry_potter":
-            return start_harry_potter_story(game_state, world_knowledge)
-        elif story_id == "shadow_serpent":
-            return start_shadow_serpent_story(game_state, world_knowledge)
-        else:
-            return "스토리를 선택해주세요:\n\n1. Harry Potter and the Sorcerer's Stone\n2. The Shadow of the Serpent's Eye"
+        story = STORIES.get(story_id)
+        if story is None:
+            return STORY_MENU_MESSAGE
+        return story["start"](game_state)
     
     # If we already have conversation history, continue the story
     # Add player action to conversation history
     game_state['conversation_history'].append(f"Player: {player_input}")
     
-    # Prepare context for AI based on the selected story
-    if story_id == "harry_potter":
-        # Create Harry Potter context
-        book_content = load_book_content('harrypotter.txt')
-        context = {
-            "world_knowledge": {
-                "book_title": "Harry Potter and the Sorcerer's Stone",
-                "universe_summary": "A magical world where wizards and witches live alongside Muggles (non-magical people). Based on the actual Harry Potter book series.",
-                "book_content": book_content[:2000],
-                "characters": [
-                    {
-                        "name": "Harry Potter",
-                        "role": "Protagonist",
-                        "description": "A young wizard who survived an attack by the dark wizard Voldemort as a baby. He has a lightning bolt scar on his forehead.",
-                        "personality": "Brave, loyal, curious, with a strong sense of justice. He's humble despite his fame.",
-                        "knowledge": "Recently discovered he is a wizard and is learning about the magical world. He knows very little about his parents or his past.",
-                        "current_goal": "Learn about his magical heritage and attend Hogwarts School of Witchcraft and Wizardry",
-                        "background": "Lives with his cruel Muggle relatives, the Dursleys, who have kept his magical heritage secret from him."
-                    },
-                    {
-                        "name": "Rubeus Hagrid",
-                        "role": "Gamekeeper at Hogwarts",
-                        "description": "A half-giant who is the gamekeeper at Hogwarts and was the first to tell Harry about his magical heritage. He's very large and has a wild beard.",
-                        "personality": "Friendly, loyal, enthusiastic, but sometimes careless. He loves magical creatures and is very protective of Harry.",
-                        "knowledge": "Knows about magical creatures and was friends with Harry's parents. He was expelled from Hogwarts but Dumbledore let him stay as gamekeeper.",
-                        "current_goal": "Help Harry adjust to the magical world and protect him",
-                        "background": "Was framed for opening the Chamber of Secrets and expelled from Hogwarts, but Dumbledore believed in his innocence."
-                    }
-                ]
-            },
-            "game_state": game_state
-        }
-    else:
-        # Use shadow serpent context
-        context = {
-            "world_knowledge": world_knowledge,
-            "game_state": game_state
-        }
+    # Prepare context for AI based on the selected story (unknown ids continue as Shadow Serpent)
+    story = STORIES.get(story_id, STORIES["shadow_serpent"])
+    context = {
+        "world_knowledge": story["world_knowledge"](),
+        "game_state": context_game_state(game_state)
+    }
     
     # Get AI response
     ai_response = call_llama_api(player_input, context)
@@ -139,23 +272,30 @@ def process_player_input(player_input: str, story_id: str = "shadow_serpent"):
     
     # Save updated game state
     save_game_state(game_state)
+    compact_history(game_state)
     
     return ai_response
 
-def load_book_content(book_file: str) -> str:
+@lru_cache(maxsize=8)
+def _read_book(book_file, max_chars):
+    """Read a book file; only successful reads are cached, errors propagate to the caller."""
+    book_path = os.path.join(BOOK_DIR, book_file)
+    with open(book_path, 'r', encoding='utf-8') as f:
+        return f.read(max_chars)
+
+def load_book_content(book_file: str, max_chars: int = -1) -> str:
     """
     Load content from a book file.
     
     Args:
         book_file: The name of the book file to load
+        max_chars: Read at most this many characters (-1 reads the whole file)
         
     Returns:
         The content of the book file
     """
     try:
-        book_path = os.path.join('book_data', book_file)
-        with open(book_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_book(book_file, max_chars)
     except FileNotFoundError:
         print(f"Book file {book_file} not found.")
         return ""
@@ -163,143 +303,89 @@ def load_book_content(book_file: str) -> str:
         print(f"Error reading book file {book_file}: {e}")
         return ""
 
-def start_harry_potter_story(game_state, world_knowledge):
-    """Initialize Harry Potter story scenario using the actual book content."""
-    # Load the actual Harry Potter book content
-    book_content = load_book_content('harrypotter.txt')
+def harry_potter_world_knowledge(opening=False):
+    """
+    Return the Harry Potter world knowledge with the opening of the book attached.
     
+    The opening turn gets the full cast, locations and key events; later turns only Harry and Hagrid.
+    """
+    knowledge = HARRY_POTTER_WORLD_KNOWLEDGE if opening else HARRY_POTTER_TURN_KNOWLEDGE
+    return {**knowledge, "book_content": load_book_content('harrypotter.txt', 2000)}
+
+def first_turn_response(story_id, prompt, context):
+    """Return an opening response for story_id, generating and storing new ones until FIRST_TURN_OPENINGS are stored."""
+    path = os.path.join(FIRST_TURNS_DIR, f'{story_id}.json')
+    openings = []
+    if not LIVE_FIRST_TURN:
+        try:
+            openings = _read_json(path)
+        except (FileNotFoundError, ValueError):
+            openings = []
+        # A truncated or hand-edited file is ignored and rebuilt from live calls
+        if not isinstance(openings, list) or not all(isinstance(text, str) and text.strip() for text in openings):
+            print(f"Ignoring malformed story openings in {path}")
+            openings = []
+        if len(openings) >= FIRST_TURN_OPENINGS:
+            return random.choice(openings)
+    
+    response = call_llama_api(prompt, context)
+    if not LIVE_FIRST_TURN and response != STORY_FALLBACK_RESPONSE and response not in openings:
+        try:
+            os.makedirs(FIRST_TURNS_DIR, exist_ok=True)
+            _write_json(path, openings + [response])
+        except Exception as e:
+            print(f"Error saving story opening: {e}")
+    return response
+
+def start_harry_potter_story(game_state, world_knowledge=None):
+    """Initialize Harry Potter story scenario using the actual book content."""
     # Create Harry Potter specific context with actual book content
     harry_potter_context = {
-        "world_knowledge": {
-            "book_title": "Harry Potter and the Sorcerer's Stone",
-            "universe_summary": "A magical world where wizards and witches live alongside Muggles (non-magical people). Based on the actual Harry Potter book series.",
-            "book_content": book_content[:2000],  # Include first 2000 characters for context
-            "characters": [
-                {
-                    "name": "Harry Potter",
-                    "role": "Protagonist",
-                    "description": "A young wizard who survived an attack by the dark wizard Voldemort as a baby. He has a lightning bolt scar on his forehead.",
-                    "personality": "Brave, loyal, curious, with a strong sense of justice. He's humble despite his fame.",
-                    "knowledge": "Recently discovered he is a wizard and is learning about the magical world. He knows very little about his parents or his past.",
-                    "current_goal": "Learn about his magical heritage and attend Hogwarts School of Witchcraft and Wizardry",
-                    "background": "Lives with his cruel Muggle relatives, the Dursleys, who have kept his magical heritage secret from him."
-                },
-                {
-                    "name": "Albus Dumbledore",
-                    "role": "Wise Wizard",
-                    "description": "The headmaster of Hogwarts School of Witchcraft and Wizardry, one of the greatest wizards of all time. He has a long silver beard and half-moon spectacles.",
-                    "personality": "Wise, kind, mysterious, with a twinkle in his eye. He speaks in riddles and has a fondness for lemon drops.",
-                    "knowledge": "Knows about Harry's past and the prophecy, expert in magic and the history of the wizarding world. He was the one who left Harry with the Dursleys.",
-                    "current_goal": "Protect Harry and guide him in his magical education",
-                    "background": "Defeated the dark wizard Grindelwald and is considered the only wizard Voldemort ever feared."
-                },
-                {
-                    "name": "Rubeus Hagrid",
-                    "role": "Gamekeeper at Hogwarts",
-                    "description": "A half-giant who is the gamekeeper at Hogwarts and was the first to tell Harry about his magical heritage. He's very large and has a wild beard.",
-                    "personality": "Friendly, loyal, enthusiastic, but sometimes careless. He loves magical creatures and is very protective of Harry.",
-                    "knowledge": "Knows about magical creatures and was friends with Harry's parents. He was expelled from Hogwarts but Dumbledore let him stay as gamekeeper.",
-                    "current_goal": "Help Harry adjust to the magical world and protect him",
-                    "background": "Was framed for opening the Chamber of Secrets and expelled from Hogwarts, but Dumbledore believed in his innocence."
-                },
-                {
-                    "name": "Vernon Dursley",
-                    "role": "Harry's Uncle",
-                    "description": "Harry's Muggle uncle who is large and beefy with hardly any neck. He works at a drill company called Grunnings.",
-                    "personality": "Proud, narrow-minded, and obsessed with being normal. He despises anything magical or unusual.",
-                    "knowledge": "Knows about magic but refuses to acknowledge it. He's terrified of being associated with the wizarding world.",
-                    "current_goal": "Keep Harry away from magic and maintain his 'normal' lifestyle",
-                    "background": "Married to Petunia, Harry's aunt. He's the father of Dudley and lives at Number 4, Privet Drive."
-                },
-                {
-                    "name": "Petunia Dursley",
-                    "role": "Harry's Aunt",
-                    "description": "Harry's Muggle aunt who is thin and blonde with a long neck. She's Lily Potter's sister.",
-                    "personality": "Jealous of her sister's magical abilities, spiteful, and obsessed with appearing normal.",
-                    "knowledge": "Knows about magic from her sister Lily but has rejected it. She's ashamed of her magical heritage.",
-                    "current_goal": "Keep Harry away from magic and pretend her sister never existed",
-                    "background": "Lily Potter's older sister who was jealous that Lily got to go to Hogwarts while she didn't."
-                }
-            ],
-            "locations": [
-                {
-                    "name": "Number 4, Privet Drive",
-                    "description": "Harry's home with his Muggle relatives, the Dursleys. A perfectly normal house in a perfectly normal neighborhood.",
-                    "characters_present": ["Harry Potter", "Vernon Dursley", "Petunia Dursley", "Dudley Dursley"],
-                    "current_situation": "Harry has just received his Hogwarts letter and the Dursleys are trying to prevent him from learning about magic."
-                },
-                {
-                    "name": "Hogwarts School of Witchcraft and Wizardry",
-                    "description": "A magical castle where young wizards and witches learn magic. It's located in Scotland and is protected by powerful magic.",
-                    "characters_present": ["Albus Dumbledore", "Rubeus Hagrid", "Students", "Teachers"],
-                    "current_situation": "The school is preparing for the new term and Harry has been accepted as a first-year student."
-                },
-                {
-                    "name": "Diagon Alley",
-                    "description": "A magical shopping street in London where wizards buy their supplies. It's hidden from Muggles behind the Leaky Cauldron pub.",
-                    "characters_present": ["Shopkeepers", "Wizards", "Rubeus Hagrid"],
-                    "current_situation": "This is where Harry will need to go to buy his school supplies for Hogwarts."
-                },
-                {
-                    "name": "The Leaky Cauldron",
-                    "description": "A famous wizarding pub in London that serves as the entrance to Diagon Alley. It's invisible to Muggles.",
-                    "characters_present": ["Tom the barman", "Wizards", "Travelers"],
-                    "current_situation": "This is where Harry will first enter the magical world, guided by Hagrid."
-                }
-            ],
-            "key_events": [
-                "The night Voldemort tried to kill Harry but failed, leaving him with his lightning bolt scar",
-                "Harry being left on the Dursleys' doorstep by Dumbledore with a letter explaining his situation",
-                "Harry growing up with the Dursleys, unaware of his magical heritage",
-                "Harry receiving his Hogwarts acceptance letter",
-                "The Dursleys trying to prevent Harry from learning about magic"
-            ]
-        },
-        "game_state": {
-            "player_character": {
-                "name": "Harry Potter",
-                "role": "Young Wizard",
-                "location": "Number 4, Privet Drive",
-                "background": "Recently discovered you are a wizard and have been invited to attend Hogwarts School of Witchcraft and Wizardry. You live with your cruel Muggle relatives who have kept your magical heritage secret.",
-                "inventory": ["Hogwarts acceptance letter", "List of school supplies"],
-                "current_goal": "Learn about the magical world and prepare for Hogwarts",
-                "knowledge": "You know very little about magic or your parents. You've been told they died in a car crash, but you're starting to suspect that's not true."
-            }
-        }
+        "world_knowledge": harry_potter_world_knowledge(opening=True),
+        "game_state": HARRY_POTTER_START_STATE
     }
     
     # Add the story selection to conversation history
-    game_state['conversation_history'] = [
-        "Narrator: You are Harry Potter, a young boy who has just discovered he is a wizard. You're sitting in your room at Number 4, Privet Drive, reading your Hogwarts acceptance letter for the hundredth time. The Dursleys have been trying to prevent you from learning about magic, but the letters keep coming. Suddenly, you hear a loud knock at the door..."
-    ]
+    game_state['conversation_history'] = [HARRY_POTTER_OPENING]
     
     save_game_state(game_state)
     
     # Use the Harry Potter context for the AI response
-    response = call_llama_api("I'm Harry Potter and I just got my Hogwarts letter. The Dursleys have been trying to hide it from me, but I want to learn about magic and my parents. What should I do?", harry_potter_context)
+    response = first_turn_response("harry_potter", "I'm Harry Potter and I just got my Hogwarts letter. The Dursleys have been trying to hide it from me, but I want to learn about magic and my parents. What should I do?", harry_potter_context)
     
     return f"Narrator: {response}"
 
 def start_shadow_serpent_story(game_state, world_knowledge):
     """Initialize Shadow of the Serpent's Eye story scenario."""
-    # Use the existing world knowledge for the shadow serpent story
-    context = {
-        "world_knowledge": world_knowledge,
-        "game_state": game_state
-    }
-    
     # Reset conversation history for the shadow serpent story
-    game_state['conversation_history'] = [
-        "Narrator: You find yourself in the dimly lit common room of the Prancing Pony Inn. The air is thick with the smell of ale and wood smoke. In the corner, a scarred figure with a weathered face watches you intently. This is Captain Thorne, a retired royal guard who knows more about your situation than he lets on. He beckons you over with a subtle gesture. What do you do?"
-    ]
+    game_state['conversation_history'] = [SHADOW_SERPENT_OPENING]
     
     save_game_state(game_state)
     
+    # Use the existing world knowledge for the shadow serpent story; the context is built
+    # after the reset so the model sees the opening scene
+    context = {
+        "world_knowledge": world_knowledge,
+        "game_state": context_game_state(game_state)
+    }
+    
     # Use the shadow serpent context for the AI response
-    response = call_llama_api("I approach the mysterious figure in the corner.", context)
+    response = first_turn_response("shadow_serpent", "I approach the mysterious figure in the corner.", context)
     
     return f"Narrator: {response}"
 
+# story_id -> how to start the story and where its world knowledge comes from
+STORIES = {
+    "harry_potter": {
+        "start": start_harry_potter_story,
+        "world_knowledge": harry_potter_world_knowledge
+    },
+    "shadow_serpent": {
+        "start": lambda game_state: start_shadow_serpent_story(game_state, load_world_knowledge()),
+        "world_knowledge": load_world_knowledge
+    }
+}
+
 def process_player_action(action):
     """Legacy function for backward compatibility."""
     game_state = load_game_state()
@@ -311,7 +397,7 @@ def process_player_action(action):
     # Prepare context for AI
     context = {
         "world_knowledge": world_knowledge,
-        "game_state": game_state
+        "game_state": context_game_state(game_state)
     }
     
     # Get AI response
@@ -322,5 +408,6 @@ def process_player_action(action):
     
     # Save updated game state
     save_game_state(game_state)
+    compact_history(game_state)
     
     return ai_response 
\ No newline at end of file
@@ -1,8 +1,198 @@
 import os
 import re
+import time
 import json
-from typing import Optional, Dict, List
-from llama_api_client import LlamaAPIClient
+import hashlib
+import threading
+import atexit
+from collections import OrderedDict
+from typing import Optional, Dict, List, Iterator
+import httpx
+from llama_api_client import LlamaAPIClient, DefaultHttpxClient
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MODEL_NAME = "Llama-4-Maverick-17B-128E-Instruct-FP8"
+
+# Static part of the Chimera system prompt. It must stay byte-identical across
+# requests so the provider can reuse its prompt cache; anything per-request
+# (world state, language, the query itself) goes after it.
+CHIMERA_CORE_PROMPT = """You are Project Chimera: Genesis Engine - an AI-powered narrative worldbuilding engine that creates and evolves entire fictional universes.
+
+You are currently operating within the Harry Potter universe, with access to the original book content and a structured world codex.
+
+CORE CAPABILITIES:
+🧠 World Anvil: You can analyze and expand the Harry Potter world with new rules, themes, and settings
+🧩 Entity Forge: Generate structured characters, factions, places, and timelines
+📚 Living Codex: Maintain persistent world state and relationships
+🌊 Ripple Engine: Simulate how events affect the world and characters
+🔮 Oracle Interface: Answer "what if" questions and explore alternate scenarios
+🎭 Scenario Synthesizer: Create new plotlines based on existing world structure
+
+RESPONSE STYLE:
+- Be creative and imaginative while staying true to Harry Potter lore
+- Reference the original book content when relevant
+- Suggest new world elements, character interactions, or plot developments
+- Consider ripple effects of any changes or scenarios
+- Maintain the magical atmosphere and tone of the Harry Potter universe
+
+For every user query, generate a creative, engaging response that:
+1. Addresses the user's query directly
+2. Incorporates Harry Potter lore and atmosphere
+3. Suggests new world elements or scenarios when appropriate
+4. Maintains the magical, enchanting tone
+5. References the living world state and potential ripple effects
+
+Before answering, decide internally which category the query falls into:
+1. CHARACTER_QUERY - Questions about characters, their motivations, relationships
+2. WORLD_EXPLORATION - Questions about locations, magic, wizarding world
+3. WHAT_IF_SCENARIO - Hypothetical scenarios or alternate timelines
+4. STORY_GENERATION - Requests for new stories, plots, or scenarios
+5. LORE_QUESTION - Questions about magical rules, history, or background
+6. INTERACTIVE_STORY - User wants to participate in or influence the story
+7. GENERAL_CHAT - General conversation or questions"""
+
+# Script and keyword patterns for detect_language, compiled once
+_KOREAN = re.compile(r'[가-힣]')
+_JAPANESE = re.compile(r'[あ-んア-ン一-龯]')
+_CHINESE = re.compile(r'[\u4e00-\u9fff]')
+_ARABIC = re.compile(r'[\u0600-\u06ff]')
+_RUSSIAN = re.compile(r'[\u0400-\u04ff]')
+_WORD = re.compile(r'\w+')
+SPANISH_WORDS = frozenset(['hola', 'gracias', 'favor', 'si', 'no', 'que', 'como', 'donde'])
+FRENCH_WORDS = frozenset(['bonjour', 'merci', 'oui', 'non', 'comment', 'ou', 'quoi'])
+GERMAN_WORDS = frozenset(['hallo', 'danke', 'ja', 'nein', 'wie', 'wo', 'was'])
+
+STORYTELLER_SYSTEM_PROMPT = """You are a master storyteller and game master running an interactive text adventure.
+You receive the world knowledge and current game state as JSON, followed by the player's action.
+Continue the story from the player's action: stay consistent with the world and the conversation so far, describe what happens vividly, voice the characters the player meets, and end by inviting the player's next move."""
+
+SUMMARY_SYSTEM_PROMPT = """You keep the running summary of an interactive story.
+Merge the new events into the story so far and reply with the updated summary only: a few short paragraphs covering who the player met, where they went, what they learned and any open threads."""
+
+# Story replies are a few paragraphs; capping the completion budget bounds decode time
+STORY_MAX_COMPLETION_TOKENS = 1024
+
+# Returned by call_llama_api when the API call fails
+STORY_FALLBACK_RESPONSE = "The story falters for a moment... Please try again."
+
+def dumps_json(obj, sort_keys: bool = False, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact unless indent is set, using orjson when it is installed"""
+    if orjson is not None:
+        option = (orjson.OPT_SORT_KEYS if sort_keys else 0) | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=dict, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys, default=dict).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys, default=dict).encode('utf-8')
+
+def normalize_query(text: str) -> str:
+    """Fold case, whitespace and trailing punctuation so near-identical queries match"""
+    return ' '.join(text.casefold().split()).rstrip(' ?!.。？！')
+
+class LLMCache:
+    """Thread-safe in-memory LRU cache of completion texts keyed by a hash of the request"""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, messages: List[Dict], **params) -> str:
+        payload = dumps_json({"model": model, "messages": messages, **params}, sort_keys=True)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+    
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+# Shown when the API call fails, keyed by detected language
+_FALLBACK_RESPONSES = {
+    'Korean': "마법의 세계에서 일시적인 혼란이 발생했습니다. 다시 시도해주세요! 🧙‍♂️✨",
+    'Japanese': "魔法世界で一時的な混乱が発生しました。もう一度お試しください！🧙‍♂️✨",
+    'Chinese': "魔法世界发生了暂时的混乱。请再试一次！🧙‍♂️✨",
+    'Arabic': "حدث اضطراب مؤقت في العالم السحري. يرجى المحاولة مرة أخرى! 🧙‍♂️✨",
+    'Russian': "В магическом мире произошла временная путаница. Пожалуйста, попробуйте еще раз! 🧙‍♂️✨",
+    'Spanish': "¡Ocurrió una confusión temporal en el mundo mágico. Por favor, inténtalo de nuevo! 🧙‍♂️✨",
+    'French': "Une confusion temporaire s'est produite dans le monde magique. Veuillez réessayer ! 🧙‍♂️✨",
+    'German': "Im magischen Reich ist eine vorübergehende Verwirrung aufgetreten. Bitte versuchen Sie es erneut! 🧙‍♂️✨",
+    'English': "A temporary confusion has occurred in the magical world. Please try again! 🧙‍♂️✨"
+}
+
+class RateLimiter:
+    """Thread-safe token bucket that keeps API requests under a per-minute limit (0 or less disables it)"""
+    
+    def __init__(self, per_minute: int):
+        self.enabled = per_minute > 0
+        self.rate = per_minute / 60.0
+        # Allow short bursts of up to a tenth of the minute's budget
+        self.capacity = max(1.0, per_minute / 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be sent"""
+        if not self.enabled:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+# Client-side request budget per process (each gunicorn worker gets its own), LLAMA_RPM<=0 turns it off;
+# the SDK retries 429/5xx with jittered exponential backoff (honouring Retry-After) up to LLAMA_MAX_RETRIES times
+_rate_limiter = RateLimiter(int(os.getenv('LLAMA_RPM', '450')))
+MAX_RETRIES = int(os.getenv('LLAMA_MAX_RETRIES', '4'))
+
+_client = None
+_client_lock = threading.Lock()
+
+def _make_http_client() -> httpx.Client:
+    """Build the keep-alive connection pool shared by all Llama API calls"""
+    limits = httpx.Limits(max_keepalive_connections=20)
+    try:
+        return DefaultHttpxClient(http2=True, limits=limits, timeout=60)
+    except ImportError:
+        # HTTP/2 needs the optional h2 package
+        return DefaultHttpxClient(limits=limits, timeout=60)
+
+def get_client() -> LlamaAPIClient:
+    """Return the process-wide LlamaAPIClient, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_key = os.getenv('Llama_API_KEY')
+                if not api_key:
+                    raise ValueError("Llama_API_KEY environment variable is not set")
+                _client = LlamaAPIClient(api_key=api_key, http_client=_make_http_client(), max_retries=MAX_RETRIES)
+                atexit.register(_client.close)
+    return _client
+
+def create_completion(**params):
+    """Send a chat completion request through the shared client, within the rate limit"""
+    _rate_limiter.acquire()
+    return get_client().chat.completions.create(**params)
 
 class ChimeraWorldEngine:
     def __init__(self):
@@ -11,7 +201,9 @@ class ChimeraWorldEngine:
         if not self.api_key:
             raise ValueError("Llama_API_KEY environment variable is not set")
         
-        self.client = LlamaAPIClient(api_key=self.api_key)
+        self.client = get_client()
+        self.response_cache = LLMCache()
+        self.query_cache = LLMCache()
         
         # Initialize the Living Codex
         self.world_codex = {
@@ -39,151 +231,146 @@ class ChimeraWorldEngine:
         
         # Load Harry Potter content
         self.load_harry_potter_content()
+        
+        # Cacheable system prefix: core prompt plus the book excerpt, built once
+        self.static_system_prompt = f"""{CHIMERA_CORE_PROMPT}
+
+HARRY POTTER WORLD CONTEXT:
+{self.harry_potter_content[:1000]}..."""
+        
+        # Serialized current_state, regenerated only after the world changes
+        self._world_state_json = None
+        self._world_dirty = True
+        # Requests are served from several threads; world_codex changes go through this lock
+        self.world_lock = threading.Lock()
+    
+    def get_world_state_json(self) -> str:
+        """Return the current world state as JSON, re-serializing only when it changed"""
+        with self.world_lock:
+            if self._world_dirty:
+                self._world_state_json = json.dumps(self.world_codex['current_state'], indent=2)
+                self._world_dirty = False
+            return self._world_state_json
+    
+    def complete(self, messages: List[Dict], **params) -> str:
+        """Run a chat completion; requests that pass temperature=0 are deterministic and reuse the cached text"""
+        if params.get('temperature') != 0:
+            completion = create_completion(model=MODEL_NAME, messages=messages, **params)
+            return completion.completion_message.content.text
+        
+        key = LLMCache.make_key(MODEL_NAME, messages, **params)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        completion = create_completion(
+            model=MODEL_NAME,
+            messages=messages,
+            **params
+        )
+        text = completion.completion_message.content.text
+        self.response_cache.set(key, text)
+        return text
     
     def load_harry_potter_content(self):
         """Load Harry Potter book content for world context"""
         try:
             with open('book_data/harrypotter.txt', 'r', encoding='utf-8') as f:
-                self.harry_potter_content = f.read()[:3000]  # First 3000 chars for context
+                self.harry_potter_content = f.read(3000)  # First 3000 chars for context
         except FileNotFoundError:
             self.harry_potter_content = "Harry Potter and the Sorcerer's Stone content not found."
     
     def detect_language(self, text: str) -> str:
         """Simple language detection based on character patterns"""
-        if re.search(r'[가-힣]', text):
+        if _KOREAN.search(text):
             return 'Korean'
-        elif re.search(r'[あ-んア-ン一-龯]', text):
+        elif _JAPANESE.search(text):
             return 'Japanese'
-        elif re.search(r'[\u4e00-\u9fff]', text):
+        elif _CHINESE.search(text):
             return 'Chinese'
-        elif re.search(r'[\u0600-\u06ff]', text):
+        elif _ARABIC.search(text):
             return 'Arabic'
-        elif re.search(r'[\u0400-\u04ff]', text):
+        elif _RUSSIAN.search(text):
             return 'Russian'
-        elif any(word in text.lower() for word in ['hola', 'gracias', 'por favor', 'si', 'no', 'que', 'como', 'donde']):
+        
+        tokens = set(_WORD.findall(text.lower()))
+        if tokens & SPANISH_WORDS:
             return 'Spanish'
-        elif any(word in text.lower() for word in ['bonjour', 'merci', 'oui', 'non', 'comment', 'ou', 'quoi']):
+        elif tokens & FRENCH_WORDS:
             return 'French'
-        elif any(word in text.lower() for word in ['hallo', 'danke', 'ja', 'nein', 'wie', 'wo', 'was']):
+        elif tokens & GERMAN_WORDS:
             return 'German'
         else:
             return 'English'
     
     def get_chimera_system_prompt(self, language: str) -> str:
-        """Get Project Chimera system prompt based on detected language"""
-        base_prompt = f"""You are Project Chimera: Genesis Engine - an AI-powered narrative worldbuilding engine that creates and evolves entire fictional universes.
-
-You are currently operating within the Harry Potter universe, with access to the original book content and a structured world codex.
-
-CORE CAPABILITIES:
-🧠 World Anvil: You can analyze and expand the Harry Potter world with new rules, themes, and settings
-🧩 Entity Forge: Generate structured characters, factions, places, and timelines
-📚 Living Codex: Maintain persistent world state and relationships
-🌊 Ripple Engine: Simulate how events affect the world and characters
-🔮 Oracle Interface: Answer "what if" questions and explore alternate scenarios
-🎭 Scenario Synthesizer: Create new plotlines based on existing world structure
+        """Get Project Chimera system prompt: static prefix first, per-request state and language last"""
+        return f"""{self.static_system_prompt}
 
 CURRENT WORLD STATE:
-- Timeline: {self.world_codex['current_state']['timeline']}
-- Active Locations: {', '.join(self.world_codex['current_state']['active_locations'])}
-- Major Events: {', '.join(self.world_codex['current_state']['major_events'])}
-
-RESPONSE STYLE:
-- Be creative and imaginative while staying true to Harry Potter lore
-- Reference the original book content when relevant
-- Suggest new world elements, character interactions, or plot developments
-- Consider ripple effects of any changes or scenarios
-- Maintain the magical atmosphere and tone of the Harry Potter universe
+{self.get_world_state_json()}
 
 Respond in {language} and maintain the enchanting, magical tone of the Harry Potter world."""
-        
-        return base_prompt
     
-    def analyze_user_query(self, user_message: str) -> Dict:
-        """Analyze user query to determine intent and context"""
-        analysis_prompt = f"""
-Analyze this user query about the Harry Potter world and categorize it:
-
-Query: "{user_message}"
-
-Categories:
-1. CHARACTER_QUERY - Questions about characters, their motivations, relationships
-2. WORLD_EXPLORATION - Questions about locations, magic, wizarding world
-3. WHAT_IF_SCENARIO - Hypothetical scenarios or alternate timelines
-4. STORY_GENERATION - Requests for new stories, plots, or scenarios
-5. LORE_QUESTION - Questions about magical rules, history, or background
-6. INTERACTIVE_STORY - User wants to participate in or influence the story
-7. GENERAL_CHAT - General conversation or questions
-
-Respond with only the category number (1-7).
-"""
-        
+    def build_messages(self, user_message: str, language: str) -> List[Dict]:
+        """Build the chat messages for a user query"""
+        return [
+            {"role": "system", "content": self.get_chimera_system_prompt(language)},
+            {"role": "user", "content": user_message}
+        ]
+    
+    def generate_world_response(self, user_message: str, language: Optional[str] = None) -> str:
+        """Classify the query and generate the contextual response in a single call"""
+        language = language or self.detect_language(user_message)
         try:
-            completion = self.client.chat.completions.create(
-                model="Llama-4-Maverick-17B-128E-Instruct-FP8",
-                messages=[{"role": "user", "content": analysis_prompt}]
-            )
-            category = completion.completion_message.content.text.strip()
-            return {"category": category, "query": user_message}
-        except:
-            return {"category": "7", "query": user_message}
+            response = self.complete(self.build_messages(user_message, language))
+            if response.strip():
+                return response
+            print("Empty response from Llama API")
+            return self.get_fallback_response(user_message, language)
+        except Exception as e:
+            print(f"Error generating response: {e}")
+            return self.get_fallback_response(user_message, language)
     
-    def generate_world_response(self, user_message: str, query_analysis: Dict) -> str:
-        """Generate contextual response based on query analysis and world state"""
-        
-        # Create context-aware prompt
-        context_prompt = f"""
-HARRY POTTER WORLD CONTEXT:
-{self.harry_potter_content[:1000]}...
-
-CURRENT WORLD STATE:
-{json.dumps(self.world_codex['current_state'], indent=2)}
-
-USER QUERY ANALYSIS:
-Category: {query_analysis['category']}
-Query: {query_analysis['query']}
-
-Generate a creative, engaging response that:
-1. Addresses the user's query directly
-2. Incorporates Harry Potter lore and atmosphere
-3. Suggests new world elements or scenarios when appropriate
-4. Maintains the magical, enchanting tone
-5. References the living world state and potential ripple effects
-
-User Query: {user_message}
-
-Response:"""
+    def stream_response(self, user_message: str) -> Iterator[str]:
+        """Yield the response text chunk by chunk as the model produces it"""
+        query_key = normalize_query(user_message)
+        cached = self.query_cache.get(query_key)
+        if cached is not None:
+            yield cached
+            return
         
+        language = self.detect_language(user_message)
+        parts = []
         try:
-            completion = self.client.chat.completions.create(
-                model="Llama-4-Maverick-17B-128E-Instruct-FP8",
-                messages=[
-                    {"role": "system", "content": self.get_chimera_system_prompt(self.detect_language(user_message))},
-                    {"role": "user", "content": context_prompt}
-                ]
+            stream = create_completion(
+                model=MODEL_NAME,
+                messages=self.build_messages(user_message, language),
+                stream=True
             )
-            return completion.completion_message.content.text
+            for chunk in stream:
+                text = chunk.event.delta.text
+                if text:
+                    parts.append(text)
+                    yield text
         except Exception as e:
-            print(f"Error generating response: {e}")
-            return self.get_fallback_response(user_message)
-    
-    def get_fallback_response(self, user_message: str) -> str:
-        """Fallback response when API fails"""
-        detected_language = self.detect_language(user_message)
+            print(f"Error streaming response: {e}")
+            if not parts:
+                yield self.get_fallback_response(user_message, language)
+            return
         
-        fallback_responses = {
-            'Korean': "마법의 세계에서 일시적인 혼란이 발생했습니다. 다시 시도해주세요! 🧙‍♂️✨",
-            'Japanese': "魔法世界で一時的な混乱が発生しました。もう一度お試しください！🧙‍♂️✨",
-            'Chinese': "魔法世界发生了暂时的混乱。请再试一次！🧙‍♂️✨",
-            'Arabic': "حدث اضطراب مؤقت في العالم السحري. يرجى المحاولة مرة أخرى! 🧙‍♂️✨",
-            'Russian': "В магическом мире произошла временная путаница. Пожалуйста, попробуйте еще раз! 🧙‍♂️✨",
-            'Spanish': "¡Ocurrió una confusión temporal en el mundo mágico. Por favor, inténtalo de nuevo! 🧙‍♂️✨",
-            'French': "Une confusion temporaire s'est produite dans le monde magique. Veuillez réessayer ! 🧙‍♂️✨",
-            'German': "Im magischen Reich ist eine vorübergehende Verwirrung aufgetreten. Bitte versuchen Sie es erneut! 🧙‍♂️✨",
-            'English': "A temporary confusion has occurred in the magical world. Please try again! 🧙‍♂️✨"
-        }
+        if not parts:
+            yield self.get_fallback_response(user_message, language)
+            return
         
-        return fallback_responses.get(detected_language, fallback_responses['English'])
+        response = ''.join(parts)
+        self.update_world_state(user_message, response)
+        self.query_cache.set(query_key, response)
+    
+    def get_fallback_response(self, user_message: str, language: Optional[str] = None) -> str:
+        """Fallback response when API fails"""
+        detected_language = language or self.detect_language(user_message)
+        return _FALLBACK_RESPONSES.get(detected_language, _FALLBACK_RESPONSES['English'])
     
     def get_response(self, user_message: str) -> str:
         """
@@ -191,15 +378,22 @@ Response:"""
         Creates living, evolving responses based on Harry Potter world
         """
         try:
-            # Analyze user query
-            query_analysis = self.analyze_user_query(user_message)
+            # Rephrasings that only differ in case, spacing or trailing punctuation share an answer
+            query_key = normalize_query(user_message)
+            cached = self.query_cache.get(query_key)
+            if cached is not None:
+                return cached
             
-            # Generate contextual response
-            response = self.generate_world_response(user_message, query_analysis)
+            language = self.detect_language(user_message)
+            
+            # Classify and respond in one call
+            response = self.generate_world_response(user_message, language)
             
             # Update world state based on interaction
             self.update_world_state(user_message, response)
             
+            if response != self.get_fallback_response(user_message, language):
+                self.query_cache.set(query_key, response)
             return response
             
         except Exception as e:
@@ -210,8 +404,72 @@ Response:"""
         """Update the living world state based on user interaction"""
         # This is a simplified version - in a full implementation,
         # this would track entities, relationships, and world changes
+        # and set self._world_dirty = True whenever current_state is modified,
+        # holding self.world_lock while it does
         pass
 
+def story_messages(prompt: str, context: Dict) -> List[Dict]:
+    """Build the chat messages for a story turn"""
+    # Static preamble, then the context (world knowledge before game state, in insertion order
+    # so the stable part stays a cacheable prefix), and only the player's action in the user turn
+    serialized = dumps_json(context).decode('utf-8')
+    return [
+        {"role": "system", "content": f"{STORYTELLER_SYSTEM_PROMPT}\n\nGAME CONTEXT:\n{serialized}"},
+        {"role": "user", "content": f"PLAYER: {prompt}"}
+    ]
+
+def call_llama_api(prompt: str, context: Dict) -> str:
+    """Continue the game story from the player's input and the game context"""
+    try:
+        completion = create_completion(
+            model=MODEL_NAME,
+            messages=story_messages(prompt, context),
+            max_completion_tokens=STORY_MAX_COMPLETION_TOKENS
+        )
+        return completion.completion_message.content.text
+    except Exception as e:
+        print(f"Error calling Llama API: {e}")
+        return STORY_FALLBACK_RESPONSE
+
+def call_llama_api_stream(prompt: str, context: Dict) -> Iterator[str]:
+    """Like call_llama_api, but yield the story text chunk by chunk as it is generated"""
+    parts = []
+    try:
+        stream = create_completion(
+            model=MODEL_NAME,
+            messages=story_messages(prompt, context),
+            max_completion_tokens=STORY_MAX_COMPLETION_TOKENS,
+            stream=True
+        )
+        for chunk in stream:
+            text = chunk.event.delta.text
+            if text:
+                parts.append(text)
+                yield text
+    except Exception as e:
+        print(f"Error streaming from Llama API: {e}")
+        if not parts:
+            yield STORY_FALLBACK_RESPONSE
+        return
+
+def summarize_history(summary: str, entries: List[str]) -> Optional[str]:
+    """Fold conversation entries into the running story summary, or return None if the call fails"""
+    events = '\n'.join(entries)
+    try:
+        completion = create_completion(
+            model=MODEL_NAME,
+            messages=[
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": f"STORY SO FAR:\n{summary or '(nothing yet)'}\n\nNEW EVENTS:\n{events}"}
+            ],
+            max_completion_tokens=400,
+            temperature=0
+        )
+        return completion.completion_message.content.text
+    except Exception as e:
+        print(f"Error summarizing history: {e}")
+        return None
+
 # Backward compatibility - keep the old class name
 class LlamaAPI(ChimeraWorldEngine):
     pass 
\ No newline at end of file